@@ -21,21 +21,30 @@ def create_valid_pipeline_run(graphene_info, external_pipeline, execution_params
         step_keys_to_execute=step_keys_to_execute,
     )
 
+    solid_selection = execution_params.selector.solid_selection
+
+    # create_run may write into the tags it is given, so always hand it a fresh dict, but only
+    # merge when both sides contribute tags
+    pipeline_tags = external_pipeline.tags
+    run_tags = execution_params.execution_metadata.tags
+    if not run_tags:
+        tags = dict(pipeline_tags)
+    elif not pipeline_tags:
+        tags = dict(run_tags)
+    else:
+        tags = merge_dicts(pipeline_tags, run_tags)
+
     return graphene_info.context.instance.create_run(
         pipeline_snapshot=external_pipeline.pipeline_snapshot,
         execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
         parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
         pipeline_name=execution_params.selector.pipeline_name,
-        run_id=execution_params.execution_metadata.run_id
-        if execution_params.execution_metadata.run_id
-        else make_new_run_id(),
-        solids_to_execute=frozenset(execution_params.selector.solid_selection)
-        if execution_params.selector.solid_selection
-        else None,
+        run_id=execution_params.execution_metadata.run_id or make_new_run_id(),
+        solids_to_execute=frozenset(solid_selection) if solid_selection else None,
         run_config=execution_params.run_config,
         mode=execution_params.mode,
         step_keys_to_execute=step_keys_to_execute,
-        tags=merge_dicts(external_pipeline.tags, execution_params.execution_metadata.tags),
+        tags=tags,
         root_run_id=execution_params.execution_metadata.root_run_id,
         parent_run_id=execution_params.execution_metadata.parent_run_id,
         status=PipelineRunStatus.NOT_STARTED,
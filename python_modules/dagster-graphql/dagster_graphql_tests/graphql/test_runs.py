@@ -1,8 +1,10 @@
 import copy
 
+from dagster_graphql.client.query import LAUNCH_PIPELINE_EXECUTION_MUTATION
 from dagster_graphql.test.utils import (
     define_context_for_file,
     execute_dagster_graphql,
+    execute_dagster_graphql_and_finish_runs,
     infer_pipeline_selector,
 )
 from dagster_graphql_tests.graphql.graphql_context_test_suite import (
@@ -12,8 +14,13 @@ from dagster_graphql_tests.graphql.graphql_context_test_suite import (
 from dagster import execute_pipeline, lambda_solid, pipeline, repository, seven
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
 from dagster.core.execution.api import execute_run
-from dagster.core.instance import DagsterInstance
+from dagster.core.instance import (
+    AIRFLOW_EXECUTION_DATE_STR,
+    IS_AIRFLOW_INGEST_PIPELINE_STR,
+    DagsterInstance,
+)
 from dagster.core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
+from dagster.core.test_utils import instance_for_test
 
 RUNS_QUERY = """
 query PipelineRunsRootQuery($selector: PipelineSelector!) {
@@ -306,6 +313,22 @@ def get_repo_at_time_2():
     return evolving_repo
 
 
+def get_airflow_ingest_repo():
+    @lambda_solid
+    def solid_A():
+        pass
+
+    @pipeline(tags={IS_AIRFLOW_INGEST_PIPELINE_STR: "true"})
+    def airflow_ingest_pipeline():
+        solid_A()
+
+    @repository
+    def airflow_ingest_repo():
+        return [airflow_ingest_pipeline]
+
+    return airflow_ingest_repo
+
+
 def test_runs_over_time():
     with seven.TemporaryDirectory() as temp_dir:
         instance = DagsterInstance.local_temp(temp_dir)
@@ -620,3 +643,29 @@ def test_run_groups():
         for run_group in result.data["runGroupsOrError"]["results"]:
             assert run_group["rootRunId"] in root_run_ids
             assert len(run_group["runs"]) == 6
+
+
+def test_launch_airflow_ingest_pipeline_without_run_tags():
+    with instance_for_test() as instance:
+        context = define_context_for_file(__file__, "get_airflow_ingest_repo", instance)
+        selector = infer_pipeline_selector(context, "airflow_ingest_pipeline")
+
+        # each launch gets its own execution date, and the pipeline's own tags are untouched
+        for _ in range(2):
+            result = execute_dagster_graphql_and_finish_runs(
+                context,
+                LAUNCH_PIPELINE_EXECUTION_MUTATION,
+                variables={"executionParams": {"selector": selector, "mode": "default"}},
+            )
+            assert (
+                result.data["launchPipelineExecution"]["__typename"] == "LaunchPipelineRunSuccess"
+            )
+            run_id = result.data["launchPipelineExecution"]["run"]["runId"]
+            assert AIRFLOW_EXECUTION_DATE_STR in instance.get_run_by_id(run_id).tags
+
+            external_pipeline = (
+                context.get_repository_location(selector["repositoryLocationName"])
+                .get_repository(selector["repositoryName"])
+                .get_full_external_pipeline(selector["pipelineName"])
+            )
+            assert external_pipeline.tags == {IS_AIRFLOW_INGEST_PIPELINE_STR: "true"}
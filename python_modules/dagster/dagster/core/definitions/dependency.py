@@ -200,12 +200,8 @@ class SolidHandle(namedtuple("_SolidHandle", "name parent")):
         """
         check.inst_param(handle, "handle", SolidHandle)
 
-        for idx in range(len(handle.path)):
-            if idx >= len(self.path):
-                return False
-            if self.path[idx] != handle.path[idx]:
-                return False
-        return True
+        ancestor_path = handle.path
+        return self.path[: len(ancestor_path)] == ancestor_path
 
     def pop(self, ancestor):
         """Return a copy of the handle with some of its ancestors pruned.
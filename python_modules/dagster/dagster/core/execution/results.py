@@ -1,4 +1,5 @@
-from collections import defaultdict
+import sys
+from contextlib import contextmanager
 
 import six
 
@@ -11,27 +12,142 @@ from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.plan.objects import StepKind
 
+_STEP_INPUT = DagsterEventType.STEP_INPUT
+_STEP_OUTPUT = DagsterEventType.STEP_OUTPUT
+_STEP_MATERIALIZATION = DagsterEventType.STEP_MATERIALIZATION
+_STEP_EXPECTATION_RESULT = DagsterEventType.STEP_EXPECTATION_RESULT
+_STEP_SUCCESS = DagsterEventType.STEP_SUCCESS
+_STEP_FAILURE = DagsterEventType.STEP_FAILURE
+_STEP_SKIPPED = DagsterEventType.STEP_SKIPPED
+_COMPUTE = StepKind.COMPUTE
+
 
 def _construct_events_by_step_key(event_list):
-    events_by_step_key = defaultdict(list)
+    events_by_step_key = {}
     for event in event_list:
-        events_by_step_key[event.step_key].append(event)
+        step_key = event.step_key
+        events = events_by_step_key.get(step_key)
+        if events is None:
+            events_by_step_key[step_key] = [event]
+        else:
+            events.append(event)
+
+    return events_by_step_key
+
+
+def _construct_events_by_solid_handle(event_list):
+    """Index step events under the string handle of the solid that emitted them and under the
+    string handle of each of that solid's ancestors, preserving event order."""
+    events_by_solid_handle = {}
+    handle_strs_by_solid_handle = {}
+    for event in event_list:
+        if not event.is_step_event:
+            continue
+
+        handle_strs = handle_strs_by_solid_handle.get(event.solid_handle)
+        if handle_strs is None:
+            path = event.solid_handle.path
+            handle_strs = [".".join(path[: idx + 1]) for idx in range(len(path))]
+            handle_strs_by_solid_handle[event.solid_handle] = handle_strs
+
+        for handle_str in handle_strs:
+            events = events_by_solid_handle.get(handle_str)
+            if events is None:
+                events_by_solid_handle[handle_str] = [event]
+            else:
+                events.append(event)
+
+    return events_by_solid_handle
+
+
+class _SharedReconstructedContext(object):
+    """Reconstructs the pipeline context and execution plan used to retrieve output values.
+
+    Outside of a :py:meth:`scope`, each retrieval reconstructs its own context and tears it down
+    before returning. Within a scope, the context is reconstructed on first use and reused by every
+    result derived from the same execution until the outermost scope exits.
+    """
 
-    return dict(events_by_step_key)
+    def __init__(self, reconstruct_context):
+        self.reconstruct_context = check.callable_param(reconstruct_context, "reconstruct_context")
+        self._scope_depth = 0
+        self._context_manager = None
+        self._context = None
+        self._execution_plan = None
+
+    @contextmanager
+    def scope(self):
+        self._scope_depth += 1
+        try:
+            yield
+        finally:
+            self._scope_depth -= 1
+            if self._scope_depth == 0 and self._context_manager is not None:
+                context_manager = self._context_manager
+                self._context_manager = None
+                self._context = None
+                self._execution_plan = None
+                context_manager.__exit__(None, None, None)
+
+    @contextmanager
+    def context_and_plan(self):
+        if not self._scope_depth:
+            with self.reconstruct_context() as context:
+                yield context, _create_execution_plan_for_context(context)
+            return
+
+        if self._context_manager is None:
+            context_manager = self.reconstruct_context()
+            context = context_manager.__enter__()
+            try:
+                execution_plan = _create_execution_plan_for_context(context)
+            except:  # pylint: disable=bare-except
+                context_manager.__exit__(*sys.exc_info())
+                raise
+
+            self._context_manager = context_manager
+            self._context = context
+            self._execution_plan = execution_plan
+
+        yield self._context, self._execution_plan
+
+
+def _create_execution_plan_for_context(context):
+    from .api import create_execution_plan
+
+    return create_execution_plan(
+        pipeline=context.pipeline,
+        run_config=context.run_config,
+        mode=context.pipeline_run.mode,
+        step_keys_to_execute=context.pipeline_run.step_keys_to_execute,
+    )
 
 
 class IContainSolidsExecutionResult(object):
-    def __init__(self, container, event_list, reconstruct_context, handle=None):
+    def __init__(
+        self, container, event_list, reconstruct_context, handle=None, shared_context=None
+    ):
         self.container = check.inst_param(container, "container", IContainSolids)
-        self.event_list = check.list_param(event_list, "step_event_list", of_type=DagsterEvent)
+        # checking every event is linear in the size of the run, so only do it when assertions
+        # are enabled (i.e. not under python -O)
+        if __debug__:
+            self.event_list = check.list_param(event_list, "step_event_list", of_type=DagsterEvent)
+        else:
+            self.event_list = check.list_param(event_list, "step_event_list")
         self.reconstruct_context = check.callable_param(reconstruct_context, "reconstruct_context")
         self.handle = check.opt_inst_param(handle, "handle", SolidHandle)
+        self._shared_context = check.opt_inst_param(
+            shared_context, "shared_context", _SharedReconstructedContext
+        ) or _SharedReconstructedContext(reconstruct_context)
         self._events_by_step_key = _construct_events_by_step_key(event_list)
+        self._events_by_solid_handle = _construct_events_by_solid_handle(event_list)
+        self._solid_handles_by_str = {}
+        self._results_by_handle_str = {}
 
     @property
     def success(self):
         """bool: Whether all steps in the execution were successful."""
-        return all([not event.is_failure for event in self.event_list])
+        return not any(event.is_failure for event in self.event_list)
 
     @property
     def step_event_list(self):
@@ -62,7 +178,7 @@ class IContainSolidsExecutionResult(object):
                 "solid.".format(name=name, container=self.container.name)
             )
 
-        return self.result_for_handle(SolidHandle(name, None))
+        return self._result_for_handle(self.container.solid_named(name), SolidHandle(name, None))
 
     def output_for_solid(self, handle_str, output_name=DEFAULT_OUTPUT):
         """Get the output of a solid by its solid handle string and output name.
@@ -82,7 +198,10 @@ class IContainSolidsExecutionResult(object):
     def solid_result_list(self):
         """List[Union[CompositeSolidExecutionResult, SolidExecutionResult]]: The results for each
         top level solid."""
-        return [self.result_for_solid(solid.name) for solid in self.container.solids]
+        return [
+            self._result_for_handle(solid, SolidHandle(solid.name, None))
+            for solid in self.container.solids
+        ]
 
     def _result_for_handle(self, solid, handle):
         if not solid:
@@ -90,30 +209,47 @@ class IContainSolidsExecutionResult(object):
                 "Can not find solid handle {handle_str}.".format(handle_str=handle.to_string())
             )
 
-        events_by_kind = defaultdict(list)
+        if self.handle:
+            handle = handle.with_ancestor(self.handle)
+        handle_str = handle.to_string()
+
+        result = self._results_by_handle_str.get(handle_str)
+        if result is not None:
+            return result
+
+        events = self._events_by_solid_handle.get(handle_str, [])
+
+        # compute is the only step kind in practice, so bucket it without going through the
+        # StepKind lookup in DagsterEvent.step_kind
+        compute_events = []
+        append_compute_event = compute_events.append
+        compute_kind_value = _COMPUTE.value
+        events_by_kind = {_COMPUTE: compute_events}
+        for event in events:
+            if event.step_kind_value == compute_kind_value:
+                append_compute_event(event)
+            else:
+                events_by_kind.setdefault(event.step_kind, []).append(event)
 
         if solid.is_composite:
-            events = []
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle.with_ancestor(self.handle)):
-                        events_by_kind[event.step_kind].append(event)
-                        events.append(event)
-
-            return CompositeSolidExecutionResult(
+            result = CompositeSolidExecutionResult(
                 solid,
                 events,
                 events_by_kind,
                 self.reconstruct_context,
-                handle=handle.with_ancestor(self.handle),
+                handle=handle,
+                shared_context=self._shared_context,
             )
         else:
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle.with_ancestor(self.handle)):
-                        events_by_kind[event.step_kind].append(event)
+            result = SolidExecutionResult(
+                solid,
+                events_by_kind,
+                self.reconstruct_context,
+                shared_context=self._shared_context,
+            )
 
-            return SolidExecutionResult(solid, events_by_kind, self.reconstruct_context)
+        self._results_by_handle_str[handle_str] = result
+        return result
 
     def result_for_handle(self, handle):
         """Get the result of a solid by its solid handle.
@@ -129,7 +265,16 @@ class IContainSolidsExecutionResult(object):
             solid.
         """
         if isinstance(handle, six.string_types):
-            handle = SolidHandle.from_string(handle)
+            handle_str = handle
+            handle = self._solid_handles_by_str.get(handle_str)
+            if handle is None:
+                # top-level handles need no parsing
+                handle = (
+                    SolidHandle(handle_str, None)
+                    if "." not in handle_str
+                    else SolidHandle.from_string(handle_str)
+                )
+                self._solid_handles_by_str[handle_str] = handle
         else:
             check.inst_param(handle, "handle", SolidHandle)
 
@@ -137,6 +282,22 @@ class IContainSolidsExecutionResult(object):
 
         return self._result_for_handle(solid, handle)
 
+    def shared_output_context(self):
+        """Reuse one reconstructed pipeline context for every output read within the block.
+
+        By default, each read of output values reconstructs the pipeline context (including, e.g.,
+        resources) and tears it down before returning. Within this context manager, the
+        reconstructed context is instead shared by this result and every solid result obtained
+        from it, and torn down when the block exits.
+
+        .. code-block:: python
+
+            with result.shared_output_context():
+                a = result.result_for_solid("a").output_value()
+                b = result.result_for_solid("b").output_value()
+        """
+        return self._shared_context.scope()
+
 
 class PipelineExecutionResult(IContainSolidsExecutionResult):
     """The result of executing a pipeline.
@@ -163,7 +324,15 @@ class CompositeSolidExecutionResult(IContainSolidsExecutionResult):
     Users should not instantiate this class.
     """
 
-    def __init__(self, solid, event_list, step_events_by_kind, reconstruct_context, handle=None):
+    def __init__(
+        self,
+        solid,
+        event_list,
+        step_events_by_kind,
+        reconstruct_context,
+        handle=None,
+        shared_context=None,
+    ):
         check.inst_param(solid, "solid", Solid)
         check.invariant(
             solid.is_composite,
@@ -179,6 +348,7 @@ class CompositeSolidExecutionResult(IContainSolidsExecutionResult):
             event_list=event_list,
             reconstruct_context=reconstruct_context,
             handle=handle,
+            shared_context=shared_context,
         )
 
     def output_values_for_solid(self, name):
@@ -253,7 +423,7 @@ class SolidExecutionResult(object):
     Users should not instantiate this class.
     """
 
-    def __init__(self, solid, step_events_by_kind, reconstruct_context):
+    def __init__(self, solid, step_events_by_kind, reconstruct_context, shared_context=None):
         check.inst_param(solid, "solid", Solid)
         check.invariant(
             not solid.is_composite,
@@ -264,21 +434,44 @@ class SolidExecutionResult(object):
             step_events_by_kind, "step_events_by_kind", key_type=StepKind, value_type=list
         )
         self.reconstruct_context = check.callable_param(reconstruct_context, "reconstruct_context")
+        self._shared_context = check.opt_inst_param(
+            shared_context, "shared_context", _SharedReconstructedContext
+        ) or _SharedReconstructedContext(reconstruct_context)
+
+        self._compute_events_by_type = {}
+        for step_event in self.compute_step_events:
+            events = self._compute_events_by_type.get(step_event.event_type)
+            if events is None:
+                self._compute_events_by_type[step_event.event_type] = [step_event]
+            else:
+                events.append(step_event)
+        self._compute_input_event_dict = None
+        self._compute_output_event_dict = None
 
     @property
     def compute_input_event_dict(self):
         """Dict[str, DagsterEvent]: All events of type ``STEP_INPUT``, keyed by input name."""
-        return {se.event_specific_data.input_name: se for se in self.input_events_during_compute}
+        if self._compute_input_event_dict is None:
+            self._compute_input_event_dict = {
+                se.event_specific_data.input_name: se
+                for se in self._compute_events_by_type.get(_STEP_INPUT, ())
+            }
+        return self._compute_input_event_dict
 
     @property
     def input_events_during_compute(self):
         """List[DagsterEvent]: All events of type ``STEP_INPUT``."""
-        return self._compute_steps_of_type(DagsterEventType.STEP_INPUT)
+        return list(self._compute_steps_of_type(_STEP_INPUT))
 
     @property
     def compute_output_event_dict(self):
         """Dict[str, DagsterEvent]: All events of type ``STEP_OUTPUT``, keyed by output name"""
-        return {se.event_specific_data.output_name: se for se in self.output_events_during_compute}
+        if self._compute_output_event_dict is None:
+            self._compute_output_event_dict = {
+                se.event_specific_data.output_name: se
+                for se in self._compute_events_by_type.get(_STEP_OUTPUT, ())
+            }
+        return self._compute_output_event_dict
 
     def get_output_event_for_compute(self, output_name="result"):
         """The ``STEP_OUTPUT`` event for the given output name.
@@ -296,12 +489,12 @@ class SolidExecutionResult(object):
     @property
     def output_events_during_compute(self):
         """List[DagsterEvent]: All events of type ``STEP_OUTPUT``."""
-        return self._compute_steps_of_type(DagsterEventType.STEP_OUTPUT)
+        return list(self._compute_steps_of_type(_STEP_OUTPUT))
 
     @property
     def compute_step_events(self):
         """List[DagsterEvent]: All events generated by execution of the solid compute function."""
-        return self.step_events_by_kind.get(StepKind.COMPUTE, [])
+        return self.step_events_by_kind.get(_COMPUTE, [])
 
     @property
     def step_events(self):
@@ -312,36 +505,34 @@ class SolidExecutionResult(object):
         """List[Materialization]: All materializations yielded by the solid."""
         return [
             mat_event.event_specific_data.materialization
-            for mat_event in self.materialization_events_during_compute
+            for mat_event in self._compute_events_by_type.get(_STEP_MATERIALIZATION, ())
         ]
 
     @property
     def materialization_events_during_compute(self):
         """List[DagsterEvent]: All events of type ``STEP_MATERIALIZATION``."""
-        return self._compute_steps_of_type(DagsterEventType.STEP_MATERIALIZATION)
+        return list(self._compute_steps_of_type(_STEP_MATERIALIZATION))
 
     @property
     def expectation_events_during_compute(self):
         """List[DagsterEvent]: All events of type ``STEP_EXPECTATION_RESULT``."""
-        return self._compute_steps_of_type(DagsterEventType.STEP_EXPECTATION_RESULT)
+        return list(self._compute_steps_of_type(_STEP_EXPECTATION_RESULT))
 
     def _compute_steps_of_type(self, dagster_event_type):
-        return list(
-            filter(lambda se: se.event_type == dagster_event_type, self.compute_step_events)
-        )
+        return self._compute_events_by_type.get(dagster_event_type, [])
 
     @property
     def expectation_results_during_compute(self):
         """List[ExpectationResult]: All expectation results yielded by the solid"""
         return [
             expt_event.event_specific_data.expectation_result
-            for expt_event in self.expectation_events_during_compute
+            for expt_event in self._compute_events_by_type.get(_STEP_EXPECTATION_RESULT, ())
         ]
 
     def get_step_success_event(self):
         """DagsterEvent: The ``STEP_SUCCESS`` event, throws if not present."""
         for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_SUCCESS:
+            if step_event.event_type is _STEP_SUCCESS:
                 return step_event
 
         check.failed("Step success not found for solid {}".format(self.solid.name))
@@ -354,18 +545,21 @@ class SolidExecutionResult(object):
                 "Cannot call compute_step_failure_event if successful"
             )
 
-        step_failure_events = self._compute_steps_of_type(DagsterEventType.STEP_FAILURE)
+        step_failure_events = self._compute_steps_of_type(_STEP_FAILURE)
         check.invariant(len(step_failure_events) == 1)
         return step_failure_events[0]
 
     @property
     def success(self):
         """bool: Whether solid execution was successful."""
+        step_failure = _STEP_FAILURE
+        step_success = _STEP_SUCCESS
         any_success = False
-        for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_FAILURE:
+        for step_event in self.step_events_by_kind.get(_COMPUTE, ()):
+            event_type = step_event.event_type
+            if event_type is step_failure:
                 return False
-            if step_event.event_type == DagsterEventType.STEP_SUCCESS:
+            if event_type is step_success:
                 any_success = True
 
         return any_success
@@ -374,10 +568,7 @@ class SolidExecutionResult(object):
     def skipped(self):
         """bool: Whether solid execution was skipped."""
         return all(
-            [
-                step_event.event_type == DagsterEventType.STEP_SKIPPED
-                for step_event in self.compute_step_events
-            ]
+            step_event.event_type is _STEP_SKIPPED for step_event in self.compute_step_events
         )
 
     @property
@@ -389,29 +580,18 @@ class SolidExecutionResult(object):
         Returns ``None`` if execution did not succeed.
 
         Note that accessing this property will reconstruct the pipeline context (including, e.g.,
-        resources) to retrieve materialized output values.
+        resources) to retrieve materialized output values, unless it is accessed within
+        :py:meth:`shared_output_context`.
         """
-        from .api import create_execution_plan
-
         if self.success and self.compute_step_events:
-            with self.reconstruct_context() as context:
-                execution_plan = create_execution_plan(
-                    pipeline=context.pipeline,
-                    run_config=context.run_config,
-                    mode=context.pipeline_run.mode,
-                    step_keys_to_execute=context.pipeline_run.step_keys_to_execute,
-                )
-                values = {}
-                for compute_step_event in self.compute_step_events:
-                    if compute_step_event.is_successful_output:
-                        values[compute_step_event.step_output_data.output_name] = self._get_value(
-                            context.for_step(
-                                execution_plan.get_step_by_key(compute_step_event.step_key)
-                            ),
-                            compute_step_event.step_output_data,
-                        )
-
-                return values
+            with self._shared_context.context_and_plan() as (context, execution_plan):
+                return {
+                    compute_step_event.step_output_data.output_name: self._get_output_value(
+                        context, execution_plan, compute_step_event
+                    )
+                    for compute_step_event in self.compute_step_events
+                    if compute_step_event.is_successful_output
+                }
         else:
             return None
 
@@ -419,7 +599,8 @@ class SolidExecutionResult(object):
         """Get a computed output value.
 
         Note that calling this method will reconstruct the pipeline context (including, e.g.,
-        resources) to retrieve materialized output values.
+        resources) to retrieve materialized output values, unless it is called within
+        :py:meth:`shared_output_context`.
 
         Args:
             output_name(str): The output name for which to retrieve the value. (default: 'result')
@@ -427,8 +608,6 @@ class SolidExecutionResult(object):
         Returns:
             Union[None, Any]: ``None`` if execution did not succeed, otherwise the output value.
         """
-        from .api import create_execution_plan
-
         check.str_param(output_name, "output_name")
 
         if not self.solid.definition.has_output(output_name):
@@ -447,21 +626,8 @@ class SolidExecutionResult(object):
                     compute_step_event.is_successful_output
                     and compute_step_event.step_output_data.output_name == output_name
                 ):
-                    with self.reconstruct_context() as context:
-                        execution_plan = create_execution_plan(
-                            pipeline=context.pipeline,
-                            run_config=context.run_config,
-                            mode=context.pipeline_run.mode,
-                            step_keys_to_execute=context.pipeline_run.step_keys_to_execute,
-                        )
-
-                        value = self._get_value(
-                            context.for_step(
-                                execution_plan.get_step_by_key(compute_step_event.step_key)
-                            ),
-                            compute_step_event.step_output_data,
-                        )
-                    return value
+                    with self._shared_context.context_and_plan() as (context, execution_plan):
+                        return self._get_output_value(context, execution_plan, compute_step_event)
 
             raise DagsterInvariantViolationError(
                 (
@@ -472,6 +638,22 @@ class SolidExecutionResult(object):
         else:
             return None
 
+    def shared_output_context(self):
+        """Reuse one reconstructed pipeline context for every output read within the block.
+
+        By default, each call to :py:meth:`output_value` or :py:attr:`output_values` reconstructs
+        the pipeline context (including, e.g., resources) and tears it down before returning.
+        Within this context manager, the reconstructed context is instead shared with the other
+        solid results obtained from the same execution result, and torn down when the block exits.
+        """
+        return self._shared_context.scope()
+
+    def _get_output_value(self, context, execution_plan, compute_step_event):
+        return self._get_value(
+            context.for_step(execution_plan.get_step_by_key(compute_step_event.step_key)),
+            compute_step_event.step_output_data,
+        )
+
     def _get_value(self, context, step_output_data):
         value = context.intermediate_storage.get_intermediate(
             context=context,
@@ -488,5 +670,5 @@ class SolidExecutionResult(object):
         """Union[None, StepFailureData]: Any data corresponding to this step's failure, if it
         failed."""
         for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_FAILURE:
+            if step_event.event_type is _STEP_FAILURE:
                 return step_event.step_failure_data
@@ -17,6 +17,8 @@ from dagster.utils import file_relative_path
 
 from .test_cli_commands import managed_grpc_instance
 
+BAR_REPO_PYTHON_FILE = file_relative_path(__file__, "test_cli_commands.py")
+
 
 def no_print(_):
     return None
@@ -61,7 +63,7 @@ def test_list_command_grpc_socket():
 
     with GrpcServerProcess(
         loadable_target_origin=LoadableTargetOrigin(
-            python_file=file_relative_path(__file__, "test_cli_commands.py"), attribute="bar"
+            python_file=BAR_REPO_PYTHON_FILE, attribute="bar"
         ),
     ).create_ephemeral_client() as api_client:
         execute_list_command(
@@ -90,7 +92,7 @@ def test_list_command_deployed_grpc():
     with instance_for_test() as instance:
         with GrpcServerProcess(
             loadable_target_origin=LoadableTargetOrigin(
-                python_file=file_relative_path(__file__, "test_cli_commands.py"), attribute="bar"
+                python_file=BAR_REPO_PYTHON_FILE, attribute="bar"
             ),
             force_port=True,
         ).create_ephemeral_client() as api_client:
@@ -126,51 +128,37 @@ def test_list_command_deployed_grpc():
                 )
 
 
-def test_list_command_cli():
-    runner = CliRunner()
-
-    result = runner.invoke(
-        pipeline_list_command,
-        ["-f", file_relative_path(__file__, "test_cli_commands.py"), "-a", "bar"],
-    )
-    assert_correct_bar_repository_output(result)
-
-    result = runner.invoke(
-        pipeline_list_command,
-        [
-            "-f",
-            file_relative_path(__file__, "test_cli_commands.py"),
-            "-a",
-            "bar",
-            "-d",
-            os.path.dirname(__file__),
-        ],
-    )
-    assert_correct_bar_repository_output(result)
-
-    result = runner.invoke(
-        pipeline_list_command,
+@pytest.mark.parametrize(
+    "cli_args",
+    [
+        ["-f", BAR_REPO_PYTHON_FILE, "-a", "bar"],
+        ["-f", BAR_REPO_PYTHON_FILE, "-a", "bar", "-d", os.path.dirname(__file__)],
         ["-m", "dagster_tests.cli_tests.command_tests.test_cli_commands", "-a", "bar"],
-    )
+        ["-w", file_relative_path(__file__, "workspace.yaml")],
+        ["-m", "dagster_tests.cli_tests.command_tests.test_cli_commands"],
+        ["-f", BAR_REPO_PYTHON_FILE],
+    ],
+)
+def test_list_command_cli(cli_args):
+    result = CliRunner().invoke(pipeline_list_command, cli_args)
     assert_correct_bar_repository_output(result)
 
+
+def test_list_command_cli_legacy_repository_yaml():
     with pytest.warns(
         UserWarning,
         match=re.escape(
             "You are using the legacy repository yaml format. Please update your file "
         ),
     ):
-        result = runner.invoke(
+        result = CliRunner().invoke(
             pipeline_list_command, ["-w", file_relative_path(__file__, "repository_module.yaml")]
         )
         assert_correct_bar_repository_output(result)
 
-    result = runner.invoke(
-        pipeline_list_command, ["-w", file_relative_path(__file__, "workspace.yaml")]
-    )
-    assert_correct_bar_repository_output(result)
 
-    result = runner.invoke(
+def test_list_command_cli_workspace_override():
+    result = CliRunner().invoke(
         pipeline_list_command,
         [
             "-w",
@@ -181,7 +169,9 @@ def test_list_command_cli():
     )
     assert_correct_extra_repository_output(result)
 
-    result = runner.invoke(
+
+def test_list_command_cli_file_and_module():
+    result = CliRunner().invoke(
         pipeline_list_command,
         [
             "-f",
@@ -194,16 +184,6 @@ def test_list_command_cli():
     )
     assert result.exit_code == 2
 
-    result = runner.invoke(
-        pipeline_list_command, ["-m", "dagster_tests.cli_tests.command_tests.test_cli_commands"],
-    )
-    assert_correct_bar_repository_output(result)
-
-    result = runner.invoke(
-        pipeline_list_command, ["-f", file_relative_path(__file__, "test_cli_commands.py")]
-    )
-    assert_correct_bar_repository_output(result)
-
 
 @pytest.mark.parametrize(
     "gen_instance",
@@ -214,7 +194,7 @@ def test_list_command(gen_instance):
         execute_list_command(
             {
                 "repository_yaml": None,
-                "python_file": file_relative_path(__file__, "test_cli_commands.py"),
+                "python_file": BAR_REPO_PYTHON_FILE,
                 "module_name": None,
                 "fn_name": "bar",
             },
@@ -225,7 +205,7 @@ def test_list_command(gen_instance):
         execute_list_command(
             {
                 "repository_yaml": None,
-                "python_file": file_relative_path(__file__, "test_cli_commands.py"),
+                "python_file": BAR_REPO_PYTHON_FILE,
                 "module_name": None,
                 "fn_name": "bar",
                 "working_directory": os.path.dirname(__file__),
@@ -23,6 +23,7 @@ from dagster import (
     lambda_solid,
     pipeline,
     reexecute_pipeline,
+    resource,
     solid,
 )
 from dagster.cli.workspace.load import location_handle_from_python_file
@@ -1071,3 +1072,77 @@ def test_multi_dep_optional():
     result = execute_pipeline(test_other_skip_upstream)
     assert result.success
     assert result.result_for_solid("collect_and").skipped
+
+
+def _tracked_resource(events):
+    @resource
+    def tracked_resource(_):
+        events.append("init")
+        try:
+            yield
+        finally:
+            events.append("teardown")
+
+    return tracked_resource
+
+
+def test_output_values_tear_down_reconstructed_context():
+    events = []
+
+    @solid(
+        output_defs=[OutputDefinition(Int, "a"), OutputDefinition(Int, "b")],
+        required_resource_keys={"tracked"},
+    )
+    def two_outputs(_):
+        yield Output(1, "a")
+        yield Output(2, "b")
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"tracked": _tracked_resource(events)})])
+    def two_outputs_pipeline():
+        two_outputs()
+
+    solid_result = execute_pipeline(two_outputs_pipeline).result_for_solid("two_outputs")
+    del events[:]
+
+    assert solid_result.output_value("a") == 1
+    assert events == ["init", "teardown"]
+
+    del events[:]
+    assert solid_result.output_values == {"a": 1, "b": 2}
+    assert events == ["init", "teardown"]
+
+    del events[:]
+    with solid_result.shared_output_context():
+        assert solid_result.output_value("a") == 1
+        assert solid_result.output_value("b") == 2
+        assert solid_result.output_values == {"a": 1, "b": 2}
+        assert events == ["init"]
+
+    assert events == ["init", "teardown"]
+
+
+def test_output_values_share_reconstructed_context_across_solids():
+    events = []
+
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @solid(input_defs=[InputDefinition("num", Int)], required_resource_keys={"tracked"})
+    def add_one(_, num):
+        return num + 1
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"tracked": _tracked_resource(events)})])
+    def add_one_pipeline():
+        add_one(return_one())
+
+    result = execute_pipeline(add_one_pipeline)
+    del events[:]
+
+    with result.shared_output_context():
+        assert result.result_for_solid("return_one").output_value() == 1
+        assert result.result_for_solid("add_one").output_value() == 2
+        assert result.output_for_solid("add_one") == 2
+        assert events == ["init"]
+
+    assert events == ["init", "teardown"]